@@ -4,8 +4,10 @@ Medic Agent API — Minimal monitoring and manual approval endpoints.
 Four endpoints, no dashboard, no auth. Returns JSON from the outcome store.
 """
 
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import FastAPI, HTTPException
 
@@ -22,18 +24,27 @@ _decision_engine: Optional[Any] = None
 _start_time: Optional[datetime] = None
 _mode: str = "observer"
 
+# /stats aggregates the whole outcome store, so results are reused briefly
+_stats_ttl_seconds: float = 1.0
+_stats_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_stats_lock = threading.Lock()
+
 
 def configure(
     outcome_store: OutcomeStore,
     decision_engine: Any,
     mode: str,
+    stats_ttl_seconds: float = 1.0,
 ) -> None:
     """Wire dependencies. Called once from main.py before serving."""
     global _outcome_store, _decision_engine, _start_time, _mode
+    global _stats_ttl_seconds, _stats_cache
     _outcome_store = outcome_store
     _decision_engine = decision_engine
     _start_time = datetime.now(timezone.utc)
     _mode = mode
+    _stats_ttl_seconds = stats_ttl_seconds
+    _stats_cache = None
 
 
 @app.get("/health")
@@ -70,8 +81,12 @@ def stats() -> Dict[str, Any]:
     if not _outcome_store:
         raise HTTPException(status_code=503, detail="Outcome store not initialized")
 
-    outcome_stats = _outcome_store.get_statistics()
-    result = outcome_stats.to_dict()
+    global _stats_cache
+    with _stats_lock:
+        now = time.monotonic()
+        if _stats_cache is None or now - _stats_cache[0] >= _stats_ttl_seconds:
+            _stats_cache = (now, _outcome_store.get_statistics().to_dict())
+        result = dict(_stats_cache[1])
 
     if _decision_engine:
         result["decision_engine"] = _decision_engine.get_statistics()
@@ -85,13 +100,7 @@ def approve(kill_id: str) -> Dict[str, Any]:
     if not _outcome_store:
         raise HTTPException(status_code=503, detail="Outcome store not initialized")
 
-    # Find the outcome for this kill
-    outcomes = _outcome_store.get_recent_outcomes(limit=500)
-    match = None
-    for o in outcomes:
-        if o.kill_id == kill_id:
-            match = o
-            break
+    match = _outcome_store.get_outcome_by_kill(kill_id)
 
     if not match:
         raise HTTPException(status_code=404, detail=f"No outcome found for kill_id: {kill_id}")
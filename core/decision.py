@@ -6,6 +6,7 @@ Supports observer mode (log-only) and live mode (actionable decisions).
 """
 
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
@@ -108,14 +109,21 @@ class _BaseDecisionEngine(DecisionEngine):
             if self._should_deny(kill_report):
                 return self._create_deny_decision(kill_report)
 
+            # Module history feeds both risk and confidence; fetch it once
+            history = self._get_module_history(kill_report.target_module)
+
             # Assess risk
-            risk_level, risk_score, factors = self._assess_risk(kill_report, siem)
+            risk_level, risk_score, factors = self._assess_risk(
+                kill_report, siem, history
+            )
 
             # Build reasoning
             reasoning = self._build_reasoning(kill_report, siem, risk_level, factors)
 
             # Calculate confidence
-            confidence = self._calculate_confidence(kill_report, siem, factors)
+            confidence = self._calculate_confidence(
+                kill_report, siem, factors, history
+            )
 
             # Determine outcome
             outcome = self._determine_outcome(risk_level, risk_score, confidence, kill_report)
@@ -181,6 +189,7 @@ class _BaseDecisionEngine(DecisionEngine):
         self,
         kill_report: KillReport,
         siem: SIEMResult,
+        module_history: Optional[Dict[str, Any]] = None,
     ) -> Tuple[RiskLevel, float, Dict[str, float]]:
         """Calculate overall risk score and level."""
         factors = {}
@@ -190,7 +199,8 @@ class _BaseDecisionEngine(DecisionEngine):
 
         # Combine SIEM FP count with outcome store history
         fp_count = siem.false_positive_history
-        module_history = self._get_module_history(kill_report.target_module)
+        if module_history is None:
+            module_history = self._get_module_history(kill_report.target_module)
         fp_count = max(fp_count, module_history.get("false_positive_count", 0))
         factors["false_positive_history"] = self._calculate_fp_factor(fp_count)
 
@@ -258,6 +268,7 @@ class _BaseDecisionEngine(DecisionEngine):
         kill_report: KillReport,
         siem: SIEMResult,
         factors: Dict[str, float],
+        history: Optional[Dict[str, Any]] = None,
     ) -> float:
         """Calculate confidence in our decision."""
         confidence = 0.5
@@ -275,7 +286,8 @@ class _BaseDecisionEngine(DecisionEngine):
             confidence += 0.1
 
         # Historical data from outcome store boosts confidence
-        history = self._get_module_history(kill_report.target_module)
+        if history is None:
+            history = self._get_module_history(kill_report.target_module)
         if history.get("incident_count", 0) > 0:
             confidence += 0.1
             # High success rate for this module = even more confident
@@ -348,8 +360,9 @@ class _BaseDecisionEngine(DecisionEngine):
             if not outcomes:
                 return {}
 
-            success_count = sum(1 for o in outcomes if o.outcome_type.value == "success")
-            failure_count = sum(1 for o in outcomes if o.outcome_type.value == "failure")
+            type_counts = Counter(o.outcome_type.value for o in outcomes)
+            success_count = type_counts["success"]
+            failure_count = type_counts["failure"]
             total = len(outcomes)
 
             return {
@@ -6,13 +6,16 @@ Supports multiple transport backends (Redis, RabbitMQ, etc.).
 """
 
 import asyncio
+import contextvars
+import inspect
 import json
+import os
+import random
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import AsyncIterator, Callable, Dict, List, Optional, Any
-import uuid
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set, Any
 
-from core.models import KillReport
+from core.models import KillReason, KillReport, Severity, generate_id
 from core.logger import get_logger, set_trace_context, LogContext
 
 logger = get_logger("core.listener")
@@ -26,6 +29,10 @@ class KillReportListener(ABC):
     and acknowledgment for different transport backends.
     """
 
+    def __init__(self) -> None:
+        self._handlers: List[Callable[[KillReport], Any]] = []
+        self._dispatch_tasks: Set[asyncio.Task] = set()
+
     @abstractmethod
     async def connect(self) -> None:
         """Establish connection to Smith event bus."""
@@ -56,6 +63,62 @@ class KillReportListener(ABC):
         """Check if the connection is healthy."""
         pass
 
+    def _schedule_dispatch(self, kill_report: KillReport) -> None:
+        """
+        Start dispatching a report without waiting for the handlers.
+
+        The listen loop goes straight back to reading the stream, so slow
+        handlers overlap with the next read. disconnect() drains the tasks.
+        """
+        if not self._handlers:
+            return
+        task = asyncio.create_task(self._dispatch(kill_report))
+        self._dispatch_tasks.add(task)
+        task.add_done_callback(self._dispatch_tasks.discard)
+
+    async def _drain_dispatch(self) -> None:
+        """Wait for in-flight handler dispatches to finish."""
+        if self._dispatch_tasks:
+            await asyncio.gather(*self._dispatch_tasks, return_exceptions=True)
+
+    async def _dispatch(self, kill_report: KillReport) -> None:
+        """
+        Run all registered handlers for a report concurrently.
+
+        Coroutine functions are called on the loop; other callables run in
+        the default executor, inside a copy of the caller's context so trace
+        IDs carry over. Whatever a handler returns is awaited if it is
+        awaitable, which covers async callable objects and
+        functools.partial-wrapped coroutine functions.
+        """
+        handlers = list(self._handlers)
+        if not handlers:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        async def run(handler: Callable[[KillReport], Any]) -> None:
+            if inspect.iscoroutinefunction(handler):
+                result = handler(kill_report)
+            else:
+                ctx = contextvars.copy_context()
+                result = await loop.run_in_executor(None, ctx.run, handler, kill_report)
+            if inspect.isawaitable(result):
+                await result
+
+        results = await asyncio.gather(
+            *(run(handler) for handler in handlers),
+            return_exceptions=True,
+        )
+        for handler, result in zip(handlers, results, strict=True):
+            if isinstance(result, BaseException):
+                name = getattr(handler, "__name__", handler)
+                logger.error(
+                    f"Handler {name!r} failed: {result!r}",
+                    exc_info=result,
+                    kill_id=kill_report.kill_id,
+                )
+
 
 class SmithEventListener(KillReportListener):
     """
@@ -72,15 +135,16 @@ class SmithEventListener(KillReportListener):
         consumer_group: str = "medic-agent",
         consumer_name: Optional[str] = None,
     ):
+        super().__init__()
         self.host = host
         self.port = port
         self.topic = topic
         self.consumer_group = consumer_group
-        self.consumer_name = consumer_name or f"medic-{uuid.uuid4().hex[:8]}"
+        self.consumer_name = consumer_name or f"medic-{os.urandom(4).hex()}"
 
         self._redis: Optional[Any] = None
+        self._ack_redis: Optional[Any] = None
         self._connected = False
-        self._handlers: List[Callable[[KillReport], Any]] = []
         self._pending_acks: Dict[str, str] = {}  # kill_id -> message_id
 
     async def connect(self) -> None:
@@ -93,7 +157,26 @@ class SmithEventListener(KillReportListener):
             return
 
         try:
-            self._redis = redis.Redis(host=self.host, port=self.port, decode_responses=True)
+            # Blocking XREADGROUP holds its connection for up to `block` ms, so
+            # the reader gets a dedicated RESP3 connection and acks/pings go
+            # through a separate pooled client that is never stalled by it.
+            self._redis = redis.Redis(
+                host=self.host,
+                port=self.port,
+                decode_responses=True,
+                protocol=3,
+                socket_keepalive=True,
+                health_check_interval=30,
+                single_connection_client=True,
+            )
+            self._ack_redis = redis.Redis(
+                host=self.host,
+                port=self.port,
+                decode_responses=True,
+                protocol=3,
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
             await self._redis.ping()
 
             # Create consumer group if it doesn't exist
@@ -118,13 +201,22 @@ class SmithEventListener(KillReportListener):
 
         except Exception as e:
             logger.error(f"Failed to connect to Smith event bus: {e}")
+            for client in (self._redis, self._ack_redis):
+                if client is not None:
+                    await client.close()
+            self._redis = None
+            self._ack_redis = None
             raise
 
     async def disconnect(self) -> None:
         """Gracefully disconnect from Redis."""
+        await self._drain_dispatch()
         if self._redis:
             await self._redis.close()
             self._redis = None
+        if self._ack_redis:
+            await self._ack_redis.close()
+            self._ack_redis = None
         self._connected = False
         logger.info("Disconnected from Smith event bus")
 
@@ -147,6 +239,7 @@ class SmithEventListener(KillReportListener):
             try:
                 kill_report = await self._read_next_message()
                 if kill_report:
+                    self._schedule_dispatch(kill_report)
                     yield kill_report
                 else:
                     # No message available, brief sleep before retry
@@ -178,62 +271,76 @@ class SmithEventListener(KillReportListener):
             if not messages:
                 return None
 
-            for stream_name, stream_messages in messages:
-                for message_id, message_data in stream_messages:
-                    # Set trace context for this message
-                    set_trace_context()
-
-                    try:
-                        kill_report = self._parse_message(message_data)
-                        self._pending_acks[kill_report.kill_id] = message_id
-
-                        logger.info(
-                            "Received kill report",
-                            kill_id=kill_report.kill_id,
-                            target_module=kill_report.target_module,
-                            severity=kill_report.severity.value,
-                        )
-
-                        return kill_report
-
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to parse kill report: {e}",
-                            message_id=message_id,
-                        )
-                        # Acknowledge bad messages to prevent reprocessing
-                        await self._redis.xack(
-                            self.topic, self.consumer_group, message_id
-                        )
+            for message_id, message_data in self._stream_entries(messages):
+                # Set trace context for this message
+                set_trace_context()
+
+                try:
+                    kill_report = self._parse_message(message_data)
+                    self._pending_acks[kill_report.kill_id] = message_id
+
+                    logger.info(
+                        "Received kill report",
+                        kill_id=kill_report.kill_id,
+                        target_module=kill_report.target_module,
+                        severity=kill_report.severity.value,
+                    )
+
+                    return kill_report
+
+                except Exception as e:
+                    logger.error(
+                        f"Failed to parse kill report: {e}",
+                        message_id=message_id,
+                    )
+                    # Acknowledge bad messages to prevent reprocessing
+                    await self._ack_redis.xack(
+                        self.topic, self.consumer_group, message_id
+                    )
 
         except Exception as e:
             logger.error(f"Error reading stream: {e}")
 
         return None
 
+    @staticmethod
+    def _stream_entries(reply: Any):
+        """
+        Yield (message_id, fields) pairs from an XREADGROUP reply.
+
+        RESP2 replies are [[stream, [(id, fields), ...]], ...]; RESP3 replies
+        are {stream: [[(id, fields), ...]]} with one extra list level.
+        """
+        if isinstance(reply, dict):
+            for batches in reply.values():
+                for entries in batches:
+                    yield from entries
+        else:
+            for _stream, entries in reply:
+                yield from entries
+
+    _JSON_FIELDS = ("evidence", "dependencies", "metadata")
+
     def _parse_message(self, message_data: Dict[str, str]) -> KillReport:
         """Parse raw message data into a KillReport."""
         # Message format: {"version": "1.0", "message_type": "KILL_REPORT", "payload": {...}}
-        if "payload" in message_data:
-            # Full message format
-            payload = json.loads(message_data["payload"])
-        elif "data" in message_data:
-            # Alternative format
-            payload = json.loads(message_data["data"])
-        else:
-            # Direct payload
-            payload = {k: v for k, v in message_data.items()}
-            # Parse any JSON strings
-            for key in ["evidence", "dependencies", "metadata"]:
-                if key in payload and isinstance(payload[key], str):
-                    payload[key] = json.loads(payload[key])
+        # or {"data": {...}}; anything else is treated as a direct payload.
+        raw = message_data.get("payload") or message_data.get("data")
+        if raw:
+            return KillReport.from_dict(json.loads(raw))
+
+        payload = dict(message_data)
+        for key in self._JSON_FIELDS:
+            value = payload.get(key)
+            if isinstance(value, str):
+                payload[key] = json.loads(value)
 
         return KillReport.from_dict(payload)
 
     def register_handler(self, handler: Callable[[KillReport], Any]) -> None:
         """Register a callback handler for incoming kill reports."""
         self._handlers.append(handler)
-        logger.debug(f"Registered handler: {handler.__name__}")
+        logger.debug(f"Registered handler: {getattr(handler, '__name__', handler)!r}")
 
     async def acknowledge(self, kill_id: str) -> bool:
         """
@@ -246,9 +353,9 @@ class SmithEventListener(KillReportListener):
             logger.warning(f"No pending ack found for kill_id: {kill_id}")
             return False
 
-        if self._redis:
+        if self._ack_redis:
             try:
-                await self._redis.xack(self.topic, self.consumer_group, message_id)
+                await self._ack_redis.xack(self.topic, self.consumer_group, message_id)
                 logger.debug(f"Acknowledged kill report", kill_id=kill_id)
                 return True
             except Exception as e:
@@ -259,11 +366,11 @@ class SmithEventListener(KillReportListener):
 
     async def health_check(self) -> bool:
         """Check if the connection to Smith event bus is healthy."""
-        if not self._redis:
+        if not self._ack_redis:
             return self._connected  # Mock mode
 
         try:
-            await self._redis.ping()
+            await self._ack_redis.ping()
             return True
         except Exception:
             return False
@@ -274,18 +381,30 @@ class MockSmithListener(KillReportListener):
     Mock listener for testing and development.
 
     Generates synthetic kill reports at configurable intervals.
+    Random fields are drawn in blocks so that interval_seconds=0 can be
+    used to load-test downstream components.
     """
 
+    BATCH_SIZE = 1024
+
+    _INSTANCE_IDS = [f"instance-{i:03d}" for i in range(1, 101)]
+    _EVIDENCE = [
+        tuple(f"evidence-{i}" for i in range(count)) for count in range(1, 4)
+    ]
+
     def __init__(
         self,
         interval_seconds: float = 5.0,
         modules: Optional[List[str]] = None,
     ):
+        super().__init__()
         self.interval_seconds = interval_seconds
         self.modules = modules or ["auth-service", "api-gateway", "data-processor"]
         self._connected = False
-        self._handlers: List[Callable[[KillReport], Any]] = []
         self._acked: set = set()
+        self._reasons = list(KillReason)
+        self._severities = list(Severity)
+        self._batch: List[tuple] = []
 
     async def connect(self) -> None:
         """Mock connection."""
@@ -295,13 +414,27 @@ class MockSmithListener(KillReportListener):
     async def disconnect(self) -> None:
         """Mock disconnection."""
         self._connected = False
+        await self._drain_dispatch()
         logger.info("Mock Smith listener disconnected")
 
+    def _refill_batch(self) -> None:
+        """Pre-draw the random fields for the next BATCH_SIZE reports."""
+        n = self.BATCH_SIZE
+        uniform = random.uniform
+        entropy = os.urandom(16 * n)
+        self._batch = list(zip(
+            [generate_id(entropy[i:i + 16]) for i in range(0, 16 * n, 16)],
+            random.choices(self.modules, k=n),
+            random.choices(self._INSTANCE_IDS, k=n),
+            random.choices(self._reasons, k=n),
+            random.choices(self._severities, k=n),
+            [uniform(0.4, 0.95) for _ in range(n)],
+            random.choices(self._EVIDENCE, k=n),
+            strict=True,
+        ))
+
     async def listen(self) -> AsyncIterator[KillReport]:
         """Generate mock kill reports at regular intervals."""
-        import random
-        from core.models import KillReason, Severity
-
         logger.info("Mock listener starting to generate kill reports")
 
         while self._connected:
@@ -312,15 +445,21 @@ class MockSmithListener(KillReportListener):
 
             set_trace_context()
 
+            if not self._batch:
+                self._refill_batch()
+            (
+                kill_id, module, instance_id, reason, severity, confidence, evidence
+            ) = self._batch.pop()
+
             kill_report = KillReport(
-                kill_id=str(uuid.uuid4()),
+                kill_id=kill_id,
                 timestamp=datetime.now(timezone.utc),
-                target_module=random.choice(self.modules),
-                target_instance_id=f"instance-{random.randint(1, 100):03d}",
-                kill_reason=random.choice(list(KillReason)),
-                severity=random.choice(list(Severity)),
-                confidence_score=random.uniform(0.4, 0.95),
-                evidence=[f"evidence-{i}" for i in range(random.randint(1, 3))],
+                target_module=module,
+                target_instance_id=instance_id,
+                kill_reason=reason,
+                severity=severity,
+                confidence_score=confidence,
+                evidence=list(evidence),
                 dependencies=[],
                 source_agent="smith-mock",
                 metadata={"mock": True},
@@ -332,6 +471,7 @@ class MockSmithListener(KillReportListener):
                 target_module=kill_report.target_module,
             )
 
+            self._schedule_dispatch(kill_report)
             yield kill_report
 
     def register_handler(self, handler: Callable[[KillReport], Any]) -> None:
@@ -5,29 +5,70 @@ Provides JSON-structured logging with correlation IDs and context fields
 for consistent, queryable log output.
 """
 
+import atexit
+import copy
+import gzip
 import json
 import logging
 import logging.handlers
 import os
+import queue
+import shutil
+import stat
 import sys
 import threading
 import time
-from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
-import uuid
 from contextvars import ContextVar
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
 # Context variables for request tracing
 _trace_id: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
 _span_id: ContextVar[Optional[str]] = ContextVar("span_id", default=None)
+# Context field dicts are copy-on-write: they are replaced, never mutated in
+# place, so formatters and LogContext can hold references without copying.
 _context_fields: ContextVar[Dict[str, Any]] = ContextVar("context_fields", default={})
 
+# Log kwargs that are also promoted to LogRecord attributes
+_STRUCTURED_FIELDS = frozenset({
+    "kill_id", "decision_id", "request_id", "query_id",
+    "target_module", "source_agent", "outcome", "risk_level",
+})
+
+# Background thread that runs the real handlers; see configure_logging()
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_log_flusher: Optional["LogFlusher"] = None
+_current_config: Optional[tuple] = None
+
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    """
+    Serialize a log entry, using orjson when it is installed.
+
+    orjson writes non-ASCII as raw UTF-8 rather than \\uXXXX escapes. Entries
+    it cannot encode, such as integers wider than 64 bits, go through the
+    stdlib encoder instead of being dropped.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, default=str)
+
 
 def set_trace_context(trace_id: Optional[str] = None, span_id: Optional[str] = None) -> None:
     """Set trace context for correlation."""
-    _trace_id.set(trace_id or str(uuid.uuid4()))
-    _span_id.set(span_id or str(uuid.uuid4())[:8])
+    _trace_id.set(trace_id or os.urandom(16).hex())
+    _span_id.set(span_id or os.urandom(4).hex())
 
 
 def get_trace_id() -> Optional[str]:
@@ -40,11 +81,14 @@ def get_span_id() -> Optional[str]:
     return _span_id.get()
 
 
+def _snapshot() -> tuple:
+    """Return the current (trace_id, span_id, context_fields) in one call."""
+    return _trace_id.get(), _span_id.get(), _context_fields.get()
+
+
 def set_context_field(key: str, value: Any) -> None:
     """Set a context field that will be included in all subsequent logs."""
-    current = _context_fields.get().copy()
-    current[key] = value
-    _context_fields.set(current)
+    _context_fields.set({**_context_fields.get(), key: value})
 
 
 def clear_context_fields() -> None:
@@ -52,6 +96,30 @@ def clear_context_fields() -> None:
     _context_fields.set({})
 
 
+@lru_cache(maxsize=4)
+def _utc_second(seconds: int, sep: str = "T") -> str:
+    """Format a whole UTC second; records arrive in order, so a tiny cache hits."""
+    return time.strftime(f"%Y-%m-%d{sep}%H:%M:%S", time.gmtime(seconds))
+
+
+def _iso_utc(created: float) -> str:
+    """ISO-8601 UTC timestamp with millisecond precision for a record time."""
+    return f"{_utc_second(int(created))}.{int(created % 1 * 1000):03d}Z"
+
+
+def _record_context(record: logging.LogRecord) -> tuple:
+    """
+    Return (trace_id, span_id, context_fields) for a record.
+
+    Records that went through the logging queue carry a snapshot taken on
+    the emitting thread; anything else reads the live context variables.
+    """
+    snapshot = record.__dict__.get("_medic_context")
+    if snapshot is not None:
+        return snapshot
+    return _snapshot()
+
+
 class JSONFormatter(logging.Formatter):
     """
     Custom formatter that outputs logs as JSON objects.
@@ -66,47 +134,45 @@ class JSONFormatter(logging.Formatter):
     - exception: Exception info if present
     """
 
+    converter = time.gmtime
+
     def __init__(self, include_extra_fields: bool = True):
         super().__init__()
         self.include_extra_fields = include_extra_fields
-        self._structured_fields = {
-            "kill_id", "decision_id", "request_id", "query_id",
-            "target_module", "source_agent", "outcome", "risk_level"
-        }
+        self._structured_fields = _STRUCTURED_FIELDS
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "timestamp": _iso_utc(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        # Add trace context
-        trace_id = get_trace_id()
-        span_id = get_span_id()
+        # Add trace context captured when the record was queued
+        trace_id, span_id, context = _record_context(record)
         if trace_id:
             log_entry["trace_id"] = trace_id
         if span_id:
             log_entry["span_id"] = span_id
 
-        # Add context fields from ContextVar
-        context = _context_fields.get()
-        if context:
-            log_entry["context"] = context.copy()
-        else:
-            log_entry["context"] = {}
-
-        # Extract structured fields from record
-        if self.include_extra_fields:
-            for field in self._structured_fields:
-                if hasattr(record, field):
-                    log_entry["context"][field] = getattr(record, field)
-
-        # Add any extra kwargs passed to the log call
-        if hasattr(record, "extra_data") and record.extra_data:
-            log_entry["context"].update(record.extra_data)
+        # Context fields are only copied when this record adds to them;
+        # otherwise the shared dict is handed to the encoder read-only.
+        record_dict = record.__dict__
+        fields = (
+            record_dict.keys() & self._structured_fields
+            if self.include_extra_fields
+            else ()
+        )
+        extra_data = record_dict.get("extra_data")
+        if fields or extra_data:
+            context = dict(context)
+            for field in fields:
+                context[field] = record_dict[field]
+            if extra_data:
+                context.update(extra_data)
+        log_entry["context"] = context
 
         # Add exception info if present
         if record.exc_info:
@@ -120,7 +186,11 @@ class JSONFormatter(logging.Formatter):
                 "function": record.funcName,
             }
 
-        return json.dumps(log_entry, default=str)
+        return _dumps(log_entry)
+
+
+# Structured fields shown on console lines, in display order
+_TEXT_FIELDS = ("kill_id", "decision_id", "request_id")
 
 
 class TextFormatter(logging.Formatter):
@@ -135,33 +205,46 @@ class TextFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    converter = time.gmtime
+
     def __init__(self, use_colors: bool = True):
         super().__init__()
         self.use_colors = use_colors
+        self._level_strs = {
+            level: f"{color}{level:8}{self.RESET}" if use_colors else f"{level:8}"
+            for level, color in self.COLORS.items()
+        }
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as colored text."""
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-        level = record.levelname
-
-        if self.use_colors:
-            color = self.COLORS.get(level, "")
-            level_str = f"{color}{level:8}{self.RESET}"
-        else:
-            level_str = f"{level:8}"
+        timestamp = _utc_second(int(record.created), " ")
+        level_str = self._level_strs.get(record.levelname)
+        if level_str is None:
+            level_str = f"{record.levelname:8}"
+
+        line = f"[{timestamp}] {level_str} {record.name}: {record.getMessage()}"
+
+        # Fast path: plain line with nothing to append
+        trace_id = _record_context(record)[0]
+        record_dict = record.__dict__
+        if (
+            trace_id is None
+            and not record.exc_info
+            and record_dict.keys().isdisjoint(_TEXT_FIELDS)
+        ):
+            return line
 
         # Build message parts
-        parts = [f"[{timestamp}] {level_str} {record.name}: {record.getMessage()}"]
+        parts = [line]
 
         # Add trace context if present
-        trace_id = get_trace_id()
         if trace_id:
             parts.append(f"  trace_id={trace_id[:8]}")
 
         # Add structured fields
-        for field in ["kill_id", "decision_id", "request_id"]:
-            if hasattr(record, field):
-                parts.append(f"  {field}={getattr(record, field)}")
+        for field in _TEXT_FIELDS:
+            if field in record_dict:
+                parts.append(f"  {field}={record_dict[field]}")
 
         # Add exception if present
         if record.exc_info:
@@ -191,15 +274,18 @@ class MedicLogger(logging.Logger):
         **kwargs: Any,
     ) -> None:
         """Override _log to support kwargs as structured fields."""
+        if not self.isEnabledFor(level):
+            return
+
         if extra is None:
             extra = {}
 
         # Store extra kwargs as structured data
         if kwargs:
             extra["extra_data"] = kwargs
-            # Also set as attributes for field extraction
-            for key, value in kwargs.items():
-                extra[key] = value
+            # Known structured fields are also set as record attributes
+            for key in kwargs.keys() & _STRUCTURED_FIELDS:
+                extra[key] = kwargs[key]
 
         super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel + 1)
 
@@ -208,6 +294,69 @@ class MedicLogger(logging.Logger):
 logging.setLoggerClass(MedicLogger)
 
 
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that carries the caller's trace context across the queue.
+
+    Formatting happens on the listener thread, where the context variables
+    of the emitting thread or task are not visible, so they are snapshotted
+    here. Exception info is kept so formatters can render it as usual.
+
+    Structured kwargs are serialized there as well, so values that are not
+    immutable scalars are copied here and later changes by the caller do
+    not show up in the log.
+
+    %-style messages are rendered on the listener thread too, unless the
+    message or an argument is mutable and could change before the record
+    is consumed.
+    """
+
+    _IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+    @staticmethod
+    def _freeze(value: Any) -> Any:
+        """Copy a mutable kwarg value, or render it if it cannot be copied."""
+        try:
+            return copy.deepcopy(value)
+        except Exception:
+            return str(value)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        args = record.args
+        if type(record.msg) is not str or (args and not (
+            type(args) is tuple
+            and all(type(arg) in self._IMMUTABLE_TYPES for arg in args)
+        )):
+            record.msg = record.getMessage()
+            record.args = None
+        extra_data = record.__dict__.get("extra_data")
+        if extra_data:
+            immutable = self._IMMUTABLE_TYPES
+            record.extra_data = {
+                key: value if type(value) in immutable else self._freeze(value)
+                for key, value in extra_data.items()
+            }
+        record._medic_context = _snapshot()
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Drain and stop the background logging threads, then close handlers."""
+    global _queue_listener, _log_flusher
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        if _log_flusher is not None:
+            _log_flusher.stop()
+            _log_flusher = None
+        for handler in _queue_listener.handlers:
+            handler.close()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def _get_rotation_interval(rotation: str) -> tuple:
     """
     Get the rotation interval for TimedRotatingFileHandler.
@@ -233,41 +382,75 @@ def _get_rotation_interval(rotation: str) -> tuple:
         return ("midnight", 1)
 
 
-def _cleanup_old_logs(log_dir: Path, base_name: str, retention_days: int) -> None:
+def _compress_log(path: str) -> None:
+    """Gzip a rotated log file in place, keeping its modification time."""
+    gz_path = path + ".gz"
+    mtime = os.stat(path).st_mtime
+    try:
+        with open(path, "rb") as src:
+            with gzip.open(gz_path, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 65536)
+    except OSError:
+        try:
+            os.unlink(gz_path)
+        except OSError:
+            pass
+        raise
+    os.utime(gz_path, (mtime, mtime))
+    os.unlink(path)
+
+
+def _cleanup_old_logs(
+    log_dir: Path,
+    base_name: str,
+    retention_days: int,
+    compress_after: float = 600.0,
+) -> None:
     """
-    Remove log files older than retention_days.
+    Remove log files older than retention_days and gzip the remaining ones.
 
     Args:
         log_dir: Directory containing log files
         base_name: Base name of the log file (e.g., "medic.log")
         retention_days: Number of days to retain log files
+        compress_after: Seconds a rotated file must be untouched before it is
+            compressed, so the rotating handler is done with it
     """
     if retention_days <= 0:
         return
 
-    cutoff_time = datetime.now() - timedelta(days=retention_days)
-    cutoff_timestamp = cutoff_time.timestamp()
+    now = time.time()
+    cutoff_timestamp = now - retention_days * 86400
+    compress_before = now - compress_after
+    base_len = len(base_name)
 
     try:
         # Find all rotated log files matching the base pattern
-        for log_file in log_dir.iterdir():
-            if not log_file.is_file():
-                continue
-
-            # Match rotated files: base_name.YYYY-MM-DD or base_name.1, base_name.2, etc.
-            file_name = log_file.name
-            if file_name.startswith(base_name) and file_name != base_name:
-                try:
-                    file_mtime = log_file.stat().st_mtime
-                    if file_mtime < cutoff_timestamp:
-                        log_file.unlink()
-                        logging.getLogger("medic.logger").debug(
-                            f"Removed old log file: {log_file}"
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                # Match rotated files: base_name.YYYY-MM-DD or base_name.1, base_name.2, etc.
+                # (optionally with a .gz suffix once compressed)
+                file_name = entry.name
+                if len(file_name) > base_len and file_name[:base_len] == base_name:
+                    try:
+                        mtime = entry.stat().st_mtime
+                        if mtime < cutoff_timestamp:
+                            os.unlink(entry.path)
+                            logging.getLogger("medic.logger").debug(
+                                f"Removed old log file: {entry.path}"
+                            )
+                        elif (
+                            mtime < compress_before
+                            and not file_name.endswith(".gz")
+                        ):
+                            _compress_log(entry.path)
+                    except OSError as e:
+                        logging.getLogger("medic.logger").warning(
+                            f"Failed to clean up old log file {entry.path}: {e}"
                         )
-                except OSError as e:
-                    logging.getLogger("medic.logger").warning(
-                        f"Failed to remove old log file {log_file}: {e}"
-                    )
     except OSError as e:
         logging.getLogger("medic.logger").warning(
             f"Failed to scan log directory {log_dir}: {e}"
@@ -335,6 +518,126 @@ class LogRetentionCleaner:
             _cleanup_old_logs(self.log_dir, self.base_name, self.retention_days)
 
 
+class _BufferedFileMixin:
+    """
+    Block-buffered file output for rotating file handlers.
+
+    StreamHandler flushes after every record; here that flush only reaches
+    the OS for ERROR and above or once flush_interval has passed. LogFlusher
+    covers records left in the buffer when logging goes quiet.
+    """
+
+    buffer_size = 65536
+    flush_interval = 0.1
+
+    _urgent = False
+    _last_flush = 0.0
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._urgent = record.levelno >= logging.ERROR
+        super().emit(record)
+
+    def flush(self) -> None:
+        if self._urgent or time.monotonic() - self._last_flush >= self.flush_interval:
+            self._urgent = False
+            self.force_flush()
+
+    def force_flush(self) -> None:
+        """Write any buffered records to the file."""
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+            self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+
+class BufferedRotatingFileHandler(
+    _BufferedFileMixin, logging.handlers.RotatingFileHandler
+):
+    """
+    Size-rotated log file with block-buffered writes.
+
+    The base shouldRollover seeks to the end of the file for every record,
+    which flushes the write buffer, so the file size is tracked here instead.
+    Sizes are counted in characters, as the base class does for the message.
+    """
+
+    _size = 0
+    _pending_len = 0
+    _regular_file = True
+
+    def _open(self):
+        stream = super()._open()
+        st = os.fstat(stream.fileno())
+        self._size = st.st_size
+        self._regular_file = stat.S_ISREG(st.st_mode)
+        return stream
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        # Never roll over anything other than regular files (bpo-45401)
+        if self.maxBytes > 0 and self._regular_file:
+            self._pending_len = len("%s\n" % self.format(record))
+            if self._size + self._pending_len >= self.maxBytes:
+                return True
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        # doRollover reopens the file, resetting _size before this record
+        self._size += self._pending_len
+        self._pending_len = 0
+
+
+class BufferedTimedRotatingFileHandler(
+    _BufferedFileMixin, logging.handlers.TimedRotatingFileHandler
+):
+    """Time-rotated log file with block-buffered writes."""
+
+
+class LogFlusher:
+    """
+    Background thread that periodically flushes buffered file handlers.
+    """
+
+    def __init__(self, handlers: list, interval: float = 0.1):
+        self.handlers = handlers
+        self.interval = interval
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._flush_loop, daemon=True, name="log-flusher"
+        )
+
+    def start(self) -> None:
+        """Start the flush thread."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the flush thread after a final flush."""
+        self._stop_event.set()
+        self._thread.join(timeout=5.0)
+
+    def _flush_loop(self) -> None:
+        """Flush handlers until stopped."""
+        while not self._stop_event.wait(self.interval):
+            for handler in self.handlers:
+                handler.force_flush()
+        for handler in self.handlers:
+            handler.force_flush()
+
+
 def configure_logging(
     level: str = "INFO",
     format_type: str = "json",
@@ -356,11 +659,19 @@ def configure_logging(
             - "size:<bytes>": Rotate when file exceeds size (e.g., "size:10485760" for 10MB)
         retention_days: Days to retain log files (default: 30, 0 to disable cleanup)
     """
+    global _queue_listener, _log_flusher, _current_config
+
+    # Reconfiguring with identical settings would only restart threads
+    config_key = (level, format_type, log_file, rotation, retention_days)
+    if config_key == _current_config and _queue_listener is not None:
+        return
+
     root_logger = logging.getLogger("medic")
     root_logger.setLevel(getattr(logging, level.upper()))
 
-    # Remove existing handlers
+    # Remove existing handlers, flushing anything still queued
     root_logger.handlers.clear()
+    _stop_queue_listener()
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -368,7 +679,7 @@ def configure_logging(
         console_handler.setFormatter(JSONFormatter())
     else:
         console_handler.setFormatter(TextFormatter())
-    root_logger.addHandler(console_handler)
+    handlers: list = [console_handler]
 
     # File handler if specified with rotation support
     if log_file:
@@ -384,7 +695,7 @@ def configure_logging(
             except (IndexError, ValueError):
                 max_bytes = 10 * 1024 * 1024  # Default 10MB
 
-            file_handler = logging.handlers.RotatingFileHandler(
+            file_handler = BufferedRotatingFileHandler(
                 log_file,
                 maxBytes=max_bytes,
                 backupCount=retention_days,  # Keep up to retention_days backup files
@@ -392,7 +703,7 @@ def configure_logging(
         else:
             # Time-based rotation
             when, interval = rotation_config
-            file_handler = logging.handlers.TimedRotatingFileHandler(
+            file_handler = BufferedTimedRotatingFileHandler(
                 log_file,
                 when=when,
                 interval=interval,
@@ -400,7 +711,9 @@ def configure_logging(
             )
 
         file_handler.setFormatter(JSONFormatter())  # Always JSON for files
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+        _log_flusher = LogFlusher([file_handler])
+        _log_flusher.start()
 
         # Start background retention cleaner for time-based rotation
         if rotation_config is not None and retention_days > 0:
@@ -408,6 +721,16 @@ def configure_logging(
                 log_path.parent, log_path.name, retention_days
             )
 
+    # Callers only enqueue records; a background thread does the formatting
+    # and the console/file I/O.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root_logger.addHandler(_ContextQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    _current_config = config_key
+
 
 def get_logger(name: str) -> MedicLogger:
     """
@@ -441,15 +764,19 @@ class LogContext:
         self._old_fields: Dict[str, Any] = {}
 
     def __enter__(self) -> "LogContext":
-        self._old_fields = _context_fields.get().copy()
-        current = _context_fields.get().copy()
-        current.update(self.fields)
-        _context_fields.set(current)
+        self._old_fields = _context_fields.get()
+        _context_fields.set({**self._old_fields, **self.fields})
         return self
 
     def __exit__(self, *args: Any) -> None:
         _context_fields.set(self._old_fields)
 
 
+def _install_default() -> None:
+    """Install console logging unless something already configured it."""
+    if not logging.getLogger("medic").handlers:
+        configure_logging(level="INFO", format_type="text")
+
+
 # Default configuration - can be overridden by configure_logging()
-configure_logging(level="INFO", format_type="text")
+_install_default()
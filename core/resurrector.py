@@ -5,8 +5,10 @@ Restarts containers that were killed by Smith, after the decision
 engine approves resurrection. Uses the Docker API directly.
 """
 
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
@@ -17,7 +19,7 @@ from core.models import KillReport, ResurrectionDecision
 logger = get_logger("core.resurrector")
 
 
-@dataclass
+@dataclass(slots=True)
 class ResurrectionResult:
     """Result of a resurrection attempt."""
     success: bool
@@ -75,14 +77,27 @@ class DockerResurrector(Resurrector):
         self.restart_timeout = restart_timeout
         self.label_prefix = label_prefix
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
         """Lazy-init Docker client."""
         if self._client is None:
-            import docker
-            self._client = docker.from_env()
+            with self._client_lock:
+                if self._client is None:
+                    import docker
+                    self._client = docker.from_env()
         return self._client
 
+    def warm_up(self) -> None:
+        """Import the Docker SDK and connect in the background."""
+        def _warm():
+            try:
+                self._get_client()
+            except Exception as e:
+                logger.warning("Docker client warm-up failed", error=str(e))
+
+        threading.Thread(target=_warm, name="docker-warmup", daemon=True).start()
+
     def _find_container(self, kill_report: KillReport):
         """
         Find the target container by instance ID or module name.
@@ -100,32 +115,46 @@ class DockerResurrector(Resurrector):
         except Exception:
             pass
 
-        # Try by label
+        # Try by label (filtered server-side, so only matches are inspected)
         label_filter = {f"{self.label_prefix}": kill_report.target_module}
         containers = client.containers.list(all=True, filters={"label": label_filter})
         if containers:
             return containers[0]
 
-        # Try by name containing module name
-        all_containers = client.containers.list(all=True)
-        for c in all_containers:
-            if kill_report.target_module in c.name:
+        # Try by name containing module name. A sparse listing avoids an
+        # inspect call per container; only the chosen one is reloaded.
+        for c in client.containers.list(all=True, sparse=True):
+            if any(kill_report.target_module in n for n in self._own_names(c)):
+                c.reload()
                 return c
 
         return None
 
+    @staticmethod
+    def _own_names(container):
+        """
+        Yield a sparse-listed container's own name without the leading "/".
+
+        "Names" also lists legacy link aliases such as "/other/alias", which
+        belong to a different container's namespace and are skipped.
+        """
+        for name in container.attrs.get("Names") or ():
+            name = name.lstrip("/")
+            if "/" not in name:
+                yield name
+
     def resurrect(
         self,
         kill_report: KillReport,
         decision: ResurrectionDecision,
     ) -> ResurrectionResult:
         """Restart the killed container via Docker API."""
-        t0 = time.monotonic()
+        t0 = time.perf_counter()
 
         try:
             container = self._find_container(kill_report)
         except Exception as e:
-            elapsed = time.monotonic() - t0
+            elapsed = time.perf_counter() - t0
             logger.error("Docker API unavailable", error=str(e))
             return ResurrectionResult(
                 success=False,
@@ -135,7 +164,7 @@ class DockerResurrector(Resurrector):
                 error=f"docker_unavailable: {e}",
             )
         if container is None:
-            elapsed = time.monotonic() - t0
+            elapsed = time.perf_counter() - t0
             logger.error(
                 "Container not found for resurrection",
                 target_module=kill_report.target_module,
@@ -163,7 +192,7 @@ class DockerResurrector(Resurrector):
         try:
             container.restart(timeout=self.restart_timeout)
         except Exception as e:
-            elapsed = time.monotonic() - t0
+            elapsed = time.perf_counter() - t0
             logger.error(
                 "Docker restart failed",
                 container_id=container_id,
@@ -181,7 +210,7 @@ class DockerResurrector(Resurrector):
         # Wait for container to be running
         container.reload()
         if container.status != "running":
-            elapsed = time.monotonic() - t0
+            elapsed = time.perf_counter() - t0
             logger.error(
                 "Container not running after restart",
                 container_id=container_id,
@@ -199,7 +228,7 @@ class DockerResurrector(Resurrector):
         # Check health if container has a healthcheck
         health_status = self._wait_for_health(container)
 
-        elapsed = time.monotonic() - t0
+        elapsed = time.perf_counter() - t0
         success = health_status in ("healthy", None)  # None = no healthcheck defined
 
         if success:
@@ -239,6 +268,8 @@ class DockerResurrector(Resurrector):
         if health is None:
             return None  # No healthcheck defined
 
+        # Poll quickly at first since most healthchecks pass within a second
+        delay = 0.1
         deadline = time.monotonic() + self.health_check_timeout
         while time.monotonic() < deadline:
             container.reload()
@@ -247,7 +278,8 @@ class DockerResurrector(Resurrector):
                 return "healthy"
             if status == "unhealthy":
                 return "unhealthy"
-            time.sleep(1)
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(delay * 1.7, 2.0)
 
         return container.attrs["State"]["Health"]["Status"]
 
@@ -271,8 +303,9 @@ class DryRunResurrector(Resurrector):
     Used in observer mode and for testing.
     """
 
-    def __init__(self):
-        self.history: list[ResurrectionResult] = []
+    def __init__(self, history_limit: int = 10_000):
+        # Bounded so long observer-mode runs don't grow without limit
+        self.history: deque[ResurrectionResult] = deque(maxlen=history_limit)
 
     def resurrect(
         self,
@@ -324,8 +357,11 @@ def create_resurrector(config: Dict[str, Any], mode: str) -> Resurrector:
         health_check_timeout=resurrector_config.get("health_check_timeout", 30),
     )
 
-    return DockerResurrector(
+    resurrector = DockerResurrector(
         health_check_timeout=resurrector_config.get("health_check_timeout", 30),
         restart_timeout=resurrector_config.get("restart_timeout", 30),
         label_prefix=resurrector_config.get("label_prefix", "medic.module"),
     )
+    # Keep the first resurrection off the SDK import and connection setup
+    resurrector.warm_up()
+    return resurrector
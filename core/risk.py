@@ -7,8 +7,9 @@ Multi-factor risk scoring with configurable weights for resurrection decisions.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-import uuid
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import time
 
 from core.models import (
     KillReport,
@@ -16,11 +17,30 @@ from core.models import (
     RiskLevel,
     KillReason,
     Severity,
+    generate_id,
 )
 from core.logger import get_logger
 
 logger = get_logger("core.risk")
 
+# Raw risk per kill reason and severity; built once rather than per assess()
+_REASON_SCORES: Dict[KillReason, float] = {
+    KillReason.THREAT_DETECTED: 0.9,
+    KillReason.ANOMALY_BEHAVIOR: 0.6,
+    KillReason.POLICY_VIOLATION: 0.5,
+    KillReason.RESOURCE_EXHAUSTION: 0.2,
+    KillReason.DEPENDENCY_CASCADE: 0.3,
+    KillReason.MANUAL_OVERRIDE: 0.4,
+}
+
+_SEVERITY_SCORES: Dict[Severity, float] = {
+    Severity.CRITICAL: 1.0,
+    Severity.HIGH: 0.8,
+    Severity.MEDIUM: 0.5,
+    Severity.LOW: 0.3,
+    Severity.INFO: 0.1,
+}
+
 
 @dataclass
 class RiskFactor:
@@ -129,12 +149,21 @@ class AdvancedRiskAssessor(RiskAssessor):
         thresholds: Optional[RiskThresholds] = None,
         critical_modules: Optional[List[str]] = None,
         outcome_store: Optional[Any] = None,
+        history_ttl_seconds: float = 60.0,
+        history_cache_size: int = 1024,
     ):
         self.weights = weights or RiskWeights()
         self.thresholds = thresholds or RiskThresholds()
         self.critical_modules = set(critical_modules or [])
         self.outcome_store = outcome_store
 
+        # Module history is an aggregate query, so reuse it for a short while.
+        # Outcomes stored within the TTL are not seen until the entry expires.
+        # Keys come from kill reports, so the cache is also size-bounded.
+        self.history_ttl_seconds = history_ttl_seconds
+        self.history_cache_size = history_cache_size
+        self._history_cache: Dict[str, Tuple[float, Mapping[str, Any]]] = {}
+
     def assess(
         self,
         kill_report: KillReport,
@@ -185,15 +214,7 @@ class AdvancedRiskAssessor(RiskAssessor):
         ))
 
         # Kill reason
-        reason_scores = {
-            KillReason.THREAT_DETECTED: 0.9,
-            KillReason.ANOMALY_BEHAVIOR: 0.6,
-            KillReason.POLICY_VIOLATION: 0.5,
-            KillReason.RESOURCE_EXHAUSTION: 0.2,
-            KillReason.DEPENDENCY_CASCADE: 0.3,
-            KillReason.MANUAL_OVERRIDE: 0.4,
-        }
-        reason_score = reason_scores.get(kill_report.kill_reason, 0.5)
+        reason_score = _REASON_SCORES.get(kill_report.kill_reason, 0.5)
         factors.append(RiskFactor(
             name="kill_reason",
             raw_value=reason_score,
@@ -203,14 +224,7 @@ class AdvancedRiskAssessor(RiskAssessor):
         ))
 
         # Severity
-        severity_scores = {
-            Severity.CRITICAL: 1.0,
-            Severity.HIGH: 0.8,
-            Severity.MEDIUM: 0.5,
-            Severity.LOW: 0.3,
-            Severity.INFO: 0.1,
-        }
-        severity_score = severity_scores.get(kill_report.severity, 0.5)
+        severity_score = _SEVERITY_SCORES.get(kill_report.severity, 0.5)
         factors.append(RiskFactor(
             name="severity",
             raw_value=severity_score,
@@ -230,10 +244,13 @@ class AdvancedRiskAssessor(RiskAssessor):
             description=f"Critical module: {'Yes' if is_critical else 'No'}",
         ))
 
-        # Calculate overall risk score
-        total_weight = sum(f.weight for f in factors)
+        # Calculate overall risk score (both sums in one pass)
+        total_weight = weighted_total = 0.0
+        for f in factors:
+            total_weight += f.weight
+            weighted_total += f.weighted_score
         if total_weight > 0:
-            risk_score = sum(f.weighted_score for f in factors) / total_weight
+            risk_score = weighted_total / total_weight
         else:
             risk_score = 0.5
 
@@ -252,7 +269,7 @@ class AdvancedRiskAssessor(RiskAssessor):
         recommendations = self._generate_recommendations(risk_level, kill_report)
 
         assessment = RiskAssessment(
-            assessment_id=str(uuid.uuid4()),
+            assessment_id=generate_id(),
             kill_id=kill_report.kill_id,
             timestamp=datetime.now(timezone.utc),
             risk_level=risk_level,
@@ -274,26 +291,53 @@ class AdvancedRiskAssessor(RiskAssessor):
 
         return assessment
 
-    def _get_module_history(self, module: str) -> Dict[str, Any]:
-        """Get historical data for a module from the outcome store."""
+    def _get_module_history(self, module: str) -> Mapping[str, Any]:
+        """
+        Get historical data for a module from the outcome store.
+
+        The result is shared with later lookups through the cache, so it is
+        returned read-only.
+        """
         if not self.outcome_store:
             return {}
 
+        now = time.monotonic()
+        cached = self._history_cache.get(module)
+        if cached is not None and now - cached[0] < self.history_ttl_seconds:
+            return cached[1]
+
         try:
             stats = self.outcome_store.get_module_statistics(module)
-            return {
+            history = MappingProxyType({
                 "incident_count_30d": stats.get("total_resurrections", 0),
                 "success_rate": stats.get("success_rate", 0.0),
                 "false_positive_count": stats.get("failure_count", 0),
-            }
+            })
+            self._store_history(module, now, history)
+            return history
         except Exception as e:
             logger.warning("Failed to get module history: %s", e)
             return {}
 
+    def _store_history(
+        self, module: str, now: float, history: Mapping[str, Any]
+    ) -> None:
+        """Cache a module's history, evicting expired then oldest entries when full."""
+        cache = self._history_cache
+        # Re-insert so dict order stays oldest-first
+        cache.pop(module, None)
+        if len(cache) >= self.history_cache_size:
+            ttl = self.history_ttl_seconds
+            for key in [k for k, (fetched, _) in cache.items() if now - fetched >= ttl]:
+                del cache[key]
+            while len(cache) >= self.history_cache_size:
+                del cache[next(iter(cache))]
+        cache[module] = (now, history)
+
     def _calculate_confidence(
         self,
         siem: SIEMResult,
-        module_history: Dict[str, Any],
+        module_history: Mapping[str, Any],
     ) -> float:
         """Calculate confidence in the risk assessment."""
         confidence = 0.5  # Base confidence
@@ -376,4 +420,6 @@ def create_risk_assessor(
         thresholds=thresholds,
         critical_modules=critical_modules,
         outcome_store=outcome_store,
+        history_ttl_seconds=risk_config.get("history_ttl_seconds", 60.0),
+        history_cache_size=risk_config.get("history_cache_size", 1024),
     )
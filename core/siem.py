@@ -191,14 +191,14 @@ class BoundarySIEMClient(SIEMClient):
         - Clamped to [0.0, 1.0]
         """
         module = kill_report.target_module
-        t0 = time.monotonic()
+        t0 = time.perf_counter()
 
         try:
             search_result = self._search_events(module, min_severity=1)
             active_alerts = self._get_active_alerts(module)
             fp_count = self._count_false_positives(module)
         except Exception as e:
-            elapsed = time.monotonic() - t0
+            elapsed = time.perf_counter() - t0
             logger.error(
                 "SIEM enrichment failed, using defaults",
                 target_module=module,
@@ -207,7 +207,7 @@ class BoundarySIEMClient(SIEMClient):
             )
             return SIEMResult()  # Fall back to defaults
 
-        elapsed = time.monotonic() - t0
+        elapsed = time.perf_counter() - t0
 
         total_events = search_result.get("total_count", 0)
         events = search_result.get("results", [])
@@ -51,6 +51,15 @@ def validate_module_name(name: str, field_name: str = "module_name") -> str:
         - Enforces character whitelist
         - Enforces length limits
     """
+    # Fast path: a well-formed value passes every check below in one pass
+    if (
+        type(name) is str
+        and len(name) <= MAX_MODULE_NAME_LENGTH
+        and ".." not in name
+        and MODULE_NAME_PATTERN.match(name)
+    ):
+        return name
+
     if not name:
         raise ValidationError(f"{field_name} cannot be empty")
 
@@ -107,6 +116,15 @@ def validate_instance_id(instance_id: str, field_name: str = "instance_id") -> s
         - Enforces character whitelist
         - Enforces length limits
     """
+    # Fast path: a well-formed value passes every check below in one pass
+    if (
+        type(instance_id) is str
+        and len(instance_id) <= MAX_INSTANCE_ID_LENGTH
+        and ".." not in instance_id
+        and INSTANCE_ID_PATTERN.match(instance_id)
+    ):
+        return instance_id
+
     if not instance_id:
         raise ValidationError(f"{field_name} cannot be empty")
 
@@ -164,6 +182,9 @@ def validate_metadata(metadata: Dict[str, Any], field_name: str = "metadata") ->
     if not isinstance(metadata, dict):
         raise ValidationError(f"{field_name} must be a dictionary")
 
+    if not metadata:
+        return metadata
+
     # Check if serializable
     try:
         serialized = json.dumps(metadata)
@@ -288,6 +309,53 @@ def validate_dependency_list(dependencies: list, field_name: str = "dependencies
     return validated
 
 
+def validate_evidence_and_dependencies(evidence: list, dependencies: list) -> tuple:
+    """
+    Validate a kill report's evidence and dependency lists together.
+
+    Args:
+        evidence: The evidence list to validate
+        dependencies: The dependency list to validate
+
+    Returns:
+        Tuple of (validated evidence, validated dependencies)
+
+    Raises:
+        ValidationError: If validation fails
+
+    Applies the same rules as validate_evidence_list and
+    validate_dependency_list. List types and counts are checked first, then
+    both lists are walked once; the per-field validators only run to report
+    a failure.
+    """
+    if (
+        type(evidence) is list
+        and type(dependencies) is list
+        and len(evidence) <= MAX_EVIDENCE_ITEMS
+        and len(dependencies) <= MAX_DEPENDENCY_COUNT
+    ):
+        for item in evidence:
+            if type(item) is not str or len(item) > MAX_EVIDENCE_ITEM_LENGTH:
+                break
+        else:
+            match = MODULE_NAME_PATTERN.match
+            for dep in dependencies:
+                if (
+                    type(dep) is not str
+                    or len(dep) > MAX_MODULE_NAME_LENGTH
+                    or ".." in dep
+                    or not match(dep)
+                ):
+                    break
+            else:
+                return evidence, list(dependencies)
+
+    return (
+        validate_evidence_list(evidence, "evidence"),
+        validate_dependency_list(dependencies, "dependencies"),
+    )
+
+
 def validate_confidence_score(score: float, field_name: str = "confidence_score") -> float:
     """
     Validate a confidence score is within [0.0, 1.0].
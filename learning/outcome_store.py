@@ -5,14 +5,17 @@ Persistent storage for resurrection outcomes, enabling learning
 from past decisions and pattern analysis.
 """
 
+import heapq
 import json
 import sqlite3
 import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from functools import wraps
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 import threading
@@ -22,6 +25,12 @@ from core.logger import get_logger
 # Type variable for generic return type
 T = TypeVar('T')
 
+# Metadata is machine-read only, so store it without whitespace
+_JSON_SEPARATORS = (",", ":")
+
+# Key for newest-first selection in the in-memory store
+_by_timestamp = attrgetter("timestamp")
+
 
 def sqlite_retry(
     max_retries: int = 3,
@@ -250,6 +259,13 @@ class OutcomeStore(ABC):
         """Get recent outcomes."""
         pass
 
+    def get_outcome_by_kill(self, kill_id: str) -> Optional[ResurrectionOutcome]:
+        """Get the most recent outcome recorded for a kill report."""
+        for outcome in self.get_recent_outcomes(limit=500):
+            if outcome.kill_id == kill_id:
+                return outcome
+        return None
+
     @abstractmethod
     def get_statistics(
         self,
@@ -322,6 +338,8 @@ class SQLiteOutcomeStore(OutcomeStore):
                 ON outcomes(timestamp);
             CREATE INDEX IF NOT EXISTS idx_outcomes_decision
                 ON outcomes(decision_id);
+            CREATE INDEX IF NOT EXISTS idx_outcomes_kill
+                ON outcomes(kill_id);
         """)
         conn.commit()
 
@@ -357,7 +375,7 @@ class SQLiteOutcomeStore(OutcomeStore):
                 outcome.feedback_source.value,
                 outcome.human_feedback,
                 outcome.corrected_decision,
-                json.dumps(outcome.metadata),
+                json.dumps(outcome.metadata, separators=_JSON_SEPARATORS),
             ),
         )
         conn.commit()
@@ -375,6 +393,22 @@ class SQLiteOutcomeStore(OutcomeStore):
             return self._row_to_outcome(row)
         return None
 
+    def get_outcome_by_kill(self, kill_id: str) -> Optional[ResurrectionOutcome]:
+        """Get the most recent outcome recorded for a kill report."""
+        conn = self._get_connection()
+        row = conn.execute(
+            """
+            SELECT * FROM outcomes
+            WHERE kill_id = ?
+            ORDER BY timestamp DESC LIMIT 1
+            """,
+            (kill_id,),
+        ).fetchone()
+
+        if row:
+            return self._row_to_outcome(row)
+        return None
+
     def get_outcomes_by_module(
         self,
         module: str,
@@ -486,82 +520,51 @@ class SQLiteOutcomeStore(OutcomeStore):
         if where_clauses:
             where_sql = "WHERE " + " AND ".join(where_clauses)
 
-        # Get counts by type
-        rows = conn.execute(
-            f"""
-            SELECT outcome_type, COUNT(*) as count
-            FROM outcomes {where_sql}
-            GROUP BY outcome_type
-            """,
-            params,
-        ).fetchall()
-
-        type_counts = {row["outcome_type"]: row["count"] for row in rows}
-
-        # Get averages for success/failure
-        success_stats = conn.execute(
-            f"""
-            SELECT AVG(original_risk_score) as avg_risk,
-                   AVG(time_to_healthy) as avg_time
-            FROM outcomes
-            {where_sql + " AND " if where_sql else "WHERE "} outcome_type = 'success'
-            """,
-            params,
-        ).fetchone()
-
-        failure_stats = conn.execute(
-            f"""
-            SELECT AVG(original_risk_score) as avg_risk
-            FROM outcomes
-            {where_sql + " AND " if where_sql else "WHERE "} outcome_type IN ('failure', 'rollback')
-            """,
-            params,
-        ).fetchone()
-
-        # Get auto-approve accuracy
-        auto_stats = conn.execute(
+        # One scan computes every aggregate instead of five separate queries
+        stats = conn.execute(
             f"""
             SELECT
+                COUNT(*) as total,
+                SUM(CASE WHEN outcome_type = 'success' THEN 1 ELSE 0 END) as success,
+                SUM(CASE WHEN outcome_type = 'failure' THEN 1 ELSE 0 END) as failure,
+                SUM(CASE WHEN outcome_type = 'rollback' THEN 1 ELSE 0 END) as rollback,
+                SUM(CASE WHEN outcome_type = 'false_positive' THEN 1 ELSE 0 END) as false_positive,
+                SUM(CASE WHEN outcome_type = 'true_positive' THEN 1 ELSE 0 END) as true_positive,
+                AVG(CASE WHEN outcome_type = 'success' THEN original_risk_score END) as avg_risk_success,
+                AVG(CASE WHEN outcome_type = 'success' THEN time_to_healthy END) as avg_time,
+                AVG(CASE WHEN outcome_type IN ('failure', 'rollback') THEN original_risk_score END) as avg_risk_failure,
                 SUM(CASE WHEN was_auto_approved = 1 AND outcome_type = 'success' THEN 1 ELSE 0 END) as auto_success,
                 SUM(CASE WHEN was_auto_approved = 1 THEN 1 ELSE 0 END) as auto_total,
                 SUM(CASE WHEN corrected_decision IS NOT NULL THEN 1 ELSE 0 END) as overrides,
-                COUNT(*) as total
+                MIN(timestamp) as min_ts,
+                MAX(timestamp) as max_ts
             FROM outcomes {where_sql}
             """,
             params,
         ).fetchone()
 
-        # Calculate date range
-        date_range = conn.execute(
-            f"""
-            SELECT MIN(timestamp) as min_ts, MAX(timestamp) as max_ts
-            FROM outcomes {where_sql}
-            """,
-            params,
-        ).fetchone()
-
-        period_start = datetime.fromisoformat(date_range["min_ts"]) if date_range["min_ts"] else datetime.now(timezone.utc)
-        period_end = datetime.fromisoformat(date_range["max_ts"]) if date_range["max_ts"] else datetime.now(timezone.utc)
+        period_start = datetime.fromisoformat(stats["min_ts"]) if stats["min_ts"] else datetime.now(timezone.utc)
+        period_end = datetime.fromisoformat(stats["max_ts"]) if stats["max_ts"] else datetime.now(timezone.utc)
 
-        total = sum(type_counts.values())
+        total = stats["total"]
 
         return OutcomeStatistics(
             total_outcomes=total,
-            success_count=type_counts.get("success", 0),
-            failure_count=type_counts.get("failure", 0),
-            rollback_count=type_counts.get("rollback", 0),
-            false_positive_count=type_counts.get("false_positive", 0),
-            true_positive_count=type_counts.get("true_positive", 0),
-            avg_risk_score_success=success_stats["avg_risk"] or 0.0,
-            avg_risk_score_failure=failure_stats["avg_risk"] or 0.0,
-            avg_time_to_healthy=success_stats["avg_time"] or 0.0,
+            success_count=stats["success"] or 0,
+            failure_count=stats["failure"] or 0,
+            rollback_count=stats["rollback"] or 0,
+            false_positive_count=stats["false_positive"] or 0,
+            true_positive_count=stats["true_positive"] or 0,
+            avg_risk_score_success=stats["avg_risk_success"] or 0.0,
+            avg_risk_score_failure=stats["avg_risk_failure"] or 0.0,
+            avg_time_to_healthy=stats["avg_time"] or 0.0,
             auto_approve_accuracy=(
-                (auto_stats["auto_success"] or 0) / auto_stats["auto_total"]
-                if (auto_stats["auto_total"] or 0) > 0 else 0.0
+                (stats["auto_success"] or 0) / stats["auto_total"]
+                if (stats["auto_total"] or 0) > 0 else 0.0
             ),
             human_override_rate=(
-                (auto_stats["overrides"] or 0) / auto_stats["total"]
-                if (auto_stats["total"] or 0) > 0 else 0.0
+                (stats["overrides"] or 0) / total
+                if total > 0 else 0.0
             ),
             period_start=period_start,
             period_end=period_end,
@@ -607,7 +610,7 @@ class SQLiteOutcomeStore(OutcomeStore):
             elif field == "metadata":
                 if isinstance(value, dict):
                     try:
-                        value = json.dumps(value)
+                        value = json.dumps(value, separators=_JSON_SEPARATORS)
                     except (TypeError, ValueError) as e:
                         logger.error(f"Failed to serialize metadata: {e}")
                         continue
@@ -707,6 +710,14 @@ class InMemoryOutcomeStore(OutcomeStore):
         """Get an outcome by ID."""
         return self._outcomes.get(outcome_id)
 
+    def get_outcome_by_kill(self, kill_id: str) -> Optional[ResurrectionOutcome]:
+        """Get the most recent outcome recorded for a kill report."""
+        return max(
+            (o for o in self._outcomes.values() if o.kill_id == kill_id),
+            key=_by_timestamp,
+            default=None,
+        )
+
     def get_outcomes_by_module(
         self,
         module: str,
@@ -719,8 +730,7 @@ class InMemoryOutcomeStore(OutcomeStore):
             if o.target_module == module
             and (since is None or o.timestamp >= since)
         ]
-        outcomes.sort(key=lambda o: o.timestamp, reverse=True)
-        return outcomes[:limit]
+        return heapq.nlargest(limit, outcomes, key=_by_timestamp)
 
     def get_outcomes_by_type(
         self,
@@ -734,8 +744,7 @@ class InMemoryOutcomeStore(OutcomeStore):
             if o.outcome_type == outcome_type
             and (since is None or o.timestamp >= since)
         ]
-        outcomes.sort(key=lambda o: o.timestamp, reverse=True)
-        return outcomes[:limit]
+        return heapq.nlargest(limit, outcomes, key=_by_timestamp)
 
     def get_recent_outcomes(
         self,
@@ -747,8 +756,7 @@ class InMemoryOutcomeStore(OutcomeStore):
             o for o in self._outcomes.values()
             if since is None or o.timestamp >= since
         ]
-        outcomes.sort(key=lambda o: o.timestamp, reverse=True)
-        return outcomes[:limit]
+        return heapq.nlargest(limit, outcomes, key=_by_timestamp)
 
     def get_statistics(
         self,
@@ -780,41 +788,59 @@ class InMemoryOutcomeStore(OutcomeStore):
                 period_end=until or now,
             )
 
-        success = [o for o in outcomes if o.outcome_type == OutcomeType.SUCCESS]
-        failures = [o for o in outcomes if o.outcome_type in (OutcomeType.FAILURE, OutcomeType.ROLLBACK)]
-        auto_approved = [o for o in outcomes if o.was_auto_approved]
-        auto_success = [o for o in auto_approved if o.outcome_type == OutcomeType.SUCCESS]
-        overrides = [o for o in outcomes if o.corrected_decision]
+        # Single fused pass; enum members are singletons so identity checks suffice
+        SUCCESS = OutcomeType.SUCCESS
+        FAILURE = OutcomeType.FAILURE
+        ROLLBACK = OutcomeType.ROLLBACK
+        type_counts: Counter = Counter()
+        success_count = failure_total = auto_approved = auto_success = overrides = 0
+        success_risk = failure_risk = time_to_healthy = 0.0
+        period_start = period_end = outcomes[0].timestamp
+
+        for o in outcomes:
+            outcome_type = o.outcome_type
+            type_counts[outcome_type] += 1
+            if outcome_type is SUCCESS:
+                success_count += 1
+                success_risk += o.original_risk_score
+                time_to_healthy += o.time_to_healthy or 0
+            elif outcome_type is FAILURE or outcome_type is ROLLBACK:
+                failure_total += 1
+                failure_risk += o.original_risk_score
+            if o.was_auto_approved:
+                auto_approved += 1
+                if outcome_type is SUCCESS:
+                    auto_success += 1
+            if o.corrected_decision:
+                overrides += 1
+            ts = o.timestamp
+            if ts < period_start:
+                period_start = ts
+            elif ts > period_end:
+                period_end = ts
 
         return OutcomeStatistics(
             total_outcomes=len(outcomes),
-            success_count=len(success),
-            failure_count=len([o for o in outcomes if o.outcome_type == OutcomeType.FAILURE]),
-            rollback_count=len([o for o in outcomes if o.outcome_type == OutcomeType.ROLLBACK]),
-            false_positive_count=len([o for o in outcomes if o.outcome_type == OutcomeType.FALSE_POSITIVE]),
-            true_positive_count=len([o for o in outcomes if o.outcome_type == OutcomeType.TRUE_POSITIVE]),
+            success_count=success_count,
+            failure_count=type_counts[FAILURE],
+            rollback_count=type_counts[ROLLBACK],
+            false_positive_count=type_counts[OutcomeType.FALSE_POSITIVE],
+            true_positive_count=type_counts[OutcomeType.TRUE_POSITIVE],
             avg_risk_score_success=(
-                sum(o.original_risk_score for o in success) / len(success)
-                if success else 0.0
+                success_risk / success_count if success_count else 0.0
             ),
             avg_risk_score_failure=(
-                sum(o.original_risk_score for o in failures) / len(failures)
-                if failures else 0.0
+                failure_risk / failure_total if failure_total else 0.0
             ),
             avg_time_to_healthy=(
-                sum(o.time_to_healthy or 0 for o in success) / len(success)
-                if success else 0.0
+                time_to_healthy / success_count if success_count else 0.0
             ),
             auto_approve_accuracy=(
-                len(auto_success) / len(auto_approved)
-                if auto_approved else 0.0
-            ),
-            human_override_rate=(
-                len(overrides) / len(outcomes)
-                if outcomes else 0.0
+                auto_success / auto_approved if auto_approved else 0.0
             ),
-            period_start=min(o.timestamp for o in outcomes),
-            period_end=max(o.timestamp for o in outcomes),
+            human_override_rate=overrides / len(outcomes),
+            period_start=period_start,
+            period_end=period_end,
         )
 
     def update_outcome(
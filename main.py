@@ -15,7 +15,6 @@ import asyncio
 import os
 import signal
 import sys
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
@@ -27,7 +26,7 @@ from api import app as api_app, configure as configure_api
 from core.decision import DecisionEngine, create_decision_engine
 from core.listener import KillReportListener, create_listener
 from core.logger import configure_logging, get_logger
-from core.models import DecisionOutcome, KillReport, ResurrectionDecision
+from core.models import DecisionOutcome, KillReport, ResurrectionDecision, generate_id
 from core.resurrector import Resurrector, create_resurrector
 from core.siem import SIEMClient, create_siem_client
 from learning.outcome_store import (
@@ -65,7 +64,7 @@ def build_outcome(
 ) -> ResurrectionOutcome:
     """Build an outcome record from a decision (no resurrection yet)."""
     return ResurrectionOutcome(
-        outcome_id=str(uuid.uuid4()),
+        outcome_id=generate_id(),
         decision_id=decision.decision_id,
         kill_id=kill_report.kill_id,
         target_module=kill_report.target_module,
@@ -167,8 +166,14 @@ async def run(config: Dict[str, Any]) -> None:
     decision_engine.calibrate()
 
     # Start API server in background
-    api_port = config.get("api", {}).get("port", 8000)
-    configure_api(outcome_store, decision_engine, mode)
+    api_config = config.get("api", {})
+    api_port = api_config.get("port", 8000)
+    configure_api(
+        outcome_store,
+        decision_engine,
+        mode,
+        stats_ttl_seconds=api_config.get("stats_ttl_seconds", 1.0),
+    )
     api_server = uvicorn.Server(uvicorn.Config(
         api_app, host="0.0.0.0", port=api_port, log_level="warning",
     ))
@@ -0,0 +1,180 @@
+"""
+Kill report listeners
+
+Stream replies are parsed in both Redis protocol shapes, and registered
+handlers (sync and async) run for every report the listener yields without
+holding up the next read.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+
+import pytest
+
+from core.listener import MockSmithListener, SmithEventListener
+from core.logger import get_trace_id
+from tests.conftest import make_kill_report
+
+
+class _FakeStreamClient:
+    """Returns one canned XREADGROUP reply and records acks."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.acked = []
+
+    async def xreadgroup(self, *args, **kwargs):
+        reply, self.reply = self.reply, None
+        return reply
+
+    async def xack(self, topic, group, message_id):
+        self.acked.append(message_id)
+
+
+def _stream_reply(shape, topic, entries):
+    if shape == "resp3":
+        return {topic: [entries]}
+    return [[topic, entries]]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", ["resp2", "resp3"])
+async def test_read_next_message_parses_reply_shapes(shape):
+    """XREADGROUP replies are parsed in both RESP2 and RESP3 form."""
+    listener = SmithEventListener()
+    report = make_kill_report()
+    payload = {"payload": json.dumps(report.to_dict())}
+    client = _FakeStreamClient(
+        _stream_reply(shape, listener.topic, [("1-0", payload)])
+    )
+    listener._redis = listener._ack_redis = client
+
+    received = await listener._read_next_message()
+
+    assert received.kill_id == report.kill_id
+    assert listener._pending_acks == {report.kill_id: "1-0"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shape", ["resp2", "resp3"])
+async def test_read_next_message_acks_unparseable(shape):
+    """Malformed entries are acknowledged instead of left pending."""
+    listener = SmithEventListener()
+    client = _FakeStreamClient(
+        _stream_reply(shape, listener.topic, [("2-0", {"payload": "not json"})])
+    )
+    listener._redis = listener._ack_redis = client
+
+    assert await listener._read_next_message() is None
+    assert client.acked == ["2-0"]
+
+
+@pytest.mark.asyncio
+async def test_handlers_dispatched_for_each_report():
+    """Sync and async handlers both see the report; a failing one is isolated."""
+    listener = MockSmithListener(interval_seconds=0)
+    seen_sync, seen_async = [], []
+
+    async def async_handler(report):
+        seen_async.append(report.kill_id)
+
+    def failing_handler(report):
+        raise RuntimeError("boom")
+
+    listener.register_handler(seen_sync.append)
+    listener.register_handler(async_handler)
+    listener.register_handler(failing_handler)
+    await listener.connect()
+
+    async for report in listener.listen():
+        break
+    await listener.disconnect()
+
+    assert seen_sync == [report]
+    assert seen_async == [report.kill_id]
+
+
+@pytest.mark.asyncio
+async def test_async_callables_and_partials_are_awaited():
+    """Awaitables returned by non-coroutine-function handlers still run."""
+    listener = MockSmithListener(interval_seconds=0)
+    seen = []
+
+    async def record(tag, report):
+        seen.append((tag, report.kill_id))
+
+    class AsyncHandler:
+        async def __call__(self, report):
+            await record("callable", report)
+
+    listener.register_handler(functools.partial(record, "partial"))
+    listener.register_handler(AsyncHandler())
+    await listener.connect()
+
+    async for report in listener.listen():
+        break
+    await listener.disconnect()
+
+    assert sorted(seen) == [("callable", report.kill_id), ("partial", report.kill_id)]
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_does_not_block_listen():
+    """Reports keep flowing while a handler is still running."""
+    listener = MockSmithListener(interval_seconds=0)
+    release = asyncio.Event()
+    done = []
+
+    async def slow_handler(report):
+        await release.wait()
+        done.append(report.kill_id)
+
+    listener.register_handler(slow_handler)
+    await listener.connect()
+
+    received = []
+    async for report in listener.listen():
+        received.append(report.kill_id)
+        if len(received) == 3:
+            break
+
+    assert done == []
+    release.set()
+    await listener.disconnect()
+    assert sorted(done) == sorted(received)
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_keep_trace_context():
+    """Handlers run in the executor see the trace ID of the report."""
+    listener = MockSmithListener(interval_seconds=0)
+    seen = []
+    listener.register_handler(lambda report: seen.append(get_trace_id()))
+    await listener.connect()
+
+    async for report in listener.listen():
+        trace_id = get_trace_id()
+        break
+    await listener.disconnect()
+
+    assert seen == [trace_id]
+
+
+@pytest.mark.asyncio
+async def test_handler_base_exceptions_are_logged(caplog):
+    """A handler raising a non-Exception error is reported with its traceback."""
+    listener = MockSmithListener(interval_seconds=0)
+
+    async def cancelled_handler(report):
+        raise asyncio.CancelledError()
+
+    listener.register_handler(cancelled_handler)
+
+    with caplog.at_level(logging.ERROR, logger="core.listener"):
+        await listener._dispatch(make_kill_report())
+
+    [record] = caplog.records
+    assert "cancelled_handler" in record.getMessage()
+    assert isinstance(record.exc_info[1], asyncio.CancelledError)
@@ -0,0 +1,117 @@
+"""
+Logging internals
+
+Log entries serialize even when the fast encoder rejects them, queued
+records are copied early enough that later mutation cannot change them,
+and buffered file handlers keep writes in memory until flushed while
+size rotation still happens at the configured limit.
+"""
+
+import json
+import logging
+import queue
+import threading
+
+from core.logger import (
+    BufferedRotatingFileHandler,
+    JSONFormatter,
+    _ContextQueueHandler,
+    _dumps,
+)
+
+
+class TestDumps:
+    """Entries the fast encoder rejects still produce a log line."""
+
+    def test_wide_int_falls_back_to_stdlib(self):
+        entry = {"value": 2**70}
+        assert json.loads(_dumps(entry)) == entry
+
+
+class TestContextQueueHandler:
+    """Records are copied eagerly whenever later mutation could change them."""
+
+    def _record(self, msg, args=None, **attrs):
+        record = logging.LogRecord(
+            "medic.test", logging.INFO, __file__, 1, msg, args, None
+        )
+        record.__dict__.update(attrs)
+        return record
+
+    def test_mutable_extra_data_copied(self):
+        modules = ["auth"]
+        lock = threading.Lock()
+        prepared = _ContextQueueHandler(queue.SimpleQueue()).prepare(
+            self._record("queued", extra_data={"modules": modules, "lock": lock})
+        )
+        modules.append("api")
+        assert prepared.extra_data["modules"] == ["auth"]
+        assert prepared.extra_data["lock"] == str(lock)
+
+
+    def test_immutable_args_deferred(self):
+        prepared = _ContextQueueHandler(queue.SimpleQueue()).prepare(
+            self._record("count=%d", (3,))
+        )
+        assert prepared.args == (3,)
+
+    def test_mutable_args_rendered(self):
+        items = [1]
+        prepared = _ContextQueueHandler(queue.SimpleQueue()).prepare(
+            self._record("items=%s", (items,))
+        )
+        items.append(2)
+        assert prepared.getMessage() == "items=[1]"
+
+    def test_non_str_message_rendered(self):
+        payload = {"state": "before"}
+        prepared = _ContextQueueHandler(queue.SimpleQueue()).prepare(
+            self._record(payload)
+        )
+        payload["state"] = "after"
+        assert prepared.getMessage() == "{'state': 'before'}"
+
+
+
+def _file_logger(name, handler):
+    handler.setFormatter(JSONFormatter())
+    log = logging.getLogger(name)
+    log.propagate = False
+    log.handlers = [handler]
+    log.setLevel(logging.INFO)
+    return log
+
+
+class TestBufferedRotatingFileHandler:
+    """Size-based rotation must not defeat the write buffer."""
+
+    def test_records_stay_buffered_until_flush(self, tmp_path):
+        path = tmp_path / "medic.log"
+        handler = BufferedRotatingFileHandler(str(path), maxBytes=10_000_000)
+        handler.flush_interval = float("inf")
+        log = _file_logger("test.buffered", handler)
+        try:
+            for i in range(200):
+                log.info("record %d", i)
+            assert path.stat().st_size == 0
+
+            handler.force_flush()
+            assert path.stat().st_size == handler._size > 0
+        finally:
+            handler.close()
+
+    def test_rolls_over_at_max_bytes(self, tmp_path):
+        path = tmp_path / "medic.log"
+        handler = BufferedRotatingFileHandler(
+            str(path), maxBytes=2000, backupCount=3
+        )
+        log = _file_logger("test.rotating", handler)
+        try:
+            for i in range(100):
+                log.info("record %d", i)
+        finally:
+            handler.close()
+
+        backups = sorted(tmp_path.glob("medic.log.*"))
+        assert len(backups) == 3
+        assert all(b.stat().st_size < 2000 for b in backups)
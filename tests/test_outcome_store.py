@@ -84,6 +84,16 @@ class TestInMemoryOutcomeStore:
         assert len(results) == 2
         assert all(o.target_module == "module-a" for o in results)
 
+    def test_get_outcome_by_kill(self):
+        """Look up an outcome by its kill ID."""
+        store = InMemoryOutcomeStore()
+        outcome = _make_outcome()
+        store.store_outcome(outcome)
+        store.store_outcome(_make_outcome())
+
+        assert store.get_outcome_by_kill(outcome.kill_id).outcome_id == outcome.outcome_id
+        assert store.get_outcome_by_kill("missing-kill") is None
+
     def test_get_statistics(self):
         """Statistics correctly aggregate outcome types."""
         store = InMemoryOutcomeStore()
@@ -159,6 +169,15 @@ class TestSQLiteOutcomeStore:
         results = store.get_outcomes_by_module("module-a")
         assert len(results) == 2
 
+    def test_get_outcome_by_kill(self, store):
+        """Kill ID lookup works in SQLite."""
+        outcome = _make_outcome()
+        store.store_outcome(outcome)
+        store.store_outcome(_make_outcome())
+
+        assert store.get_outcome_by_kill(outcome.kill_id).outcome_id == outcome.outcome_id
+        assert store.get_outcome_by_kill("missing-kill") is None
+
     def test_statistics_on_empty_db(self, store):
         """Statistics on empty database should not crash."""
         stats = store.get_statistics()
@@ -8,6 +8,7 @@ assert expected risk_score, risk_level, and decision outcomes.
 import pytest
 
 from core.decision import DecisionConfig, LiveDecisionEngine
+from core.risk import AdvancedRiskAssessor
 from core.models import (
     DecisionOutcome,
     KillReason,
@@ -157,6 +158,66 @@ class TestRiskScoring:
         assert d2.confidence >= d1.confidence
 
 
+class TestRiskLevelFromScore:
+    """Verify score-to-level bucketing, including exact boundaries."""
+
+    @pytest.mark.parametrize("score, expected", [
+        (0.0, RiskLevel.MINIMAL),
+        (0.19999999999999998, RiskLevel.MINIMAL),
+        (0.2, RiskLevel.LOW),
+        (0.4, RiskLevel.MEDIUM),
+        (0.6, RiskLevel.HIGH),
+        (0.7999, RiskLevel.HIGH),
+        (0.8, RiskLevel.CRITICAL),
+        (1.0, RiskLevel.CRITICAL),
+        (-0.5, RiskLevel.MINIMAL),
+        (1.5, RiskLevel.CRITICAL),
+    ])
+    def test_from_score(self, score, expected):
+        """Lower bounds are inclusive; out-of-range scores clamp to the ends."""
+        assert RiskLevel.from_score(score) == expected
+
+
+class TestRiskAssessorHistoryCache:
+    """Module history lookups are reused within the TTL."""
+
+    class _CountingStore:
+        def __init__(self):
+            self.calls = 0
+
+        def get_module_statistics(self, module):
+            self.calls += 1
+            return {"total_resurrections": 4, "success_rate": 0.75, "failure_count": 1}
+
+    def test_history_cached_within_ttl(self):
+        store = self._CountingStore()
+        assessor = AdvancedRiskAssessor(outcome_store=store)
+        first = assessor.assess(make_kill_report())
+        second = assessor.assess(make_kill_report())
+        assert store.calls == 1
+        assert first.risk_score == second.risk_score
+
+    def test_history_refetched_when_ttl_disabled(self):
+        store = self._CountingStore()
+        assessor = AdvancedRiskAssessor(outcome_store=store, history_ttl_seconds=0)
+        assessor.assess(make_kill_report())
+        assessor.assess(make_kill_report())
+        assert store.calls == 2
+
+    def test_history_cache_is_bounded(self):
+        store = self._CountingStore()
+        assessor = AdvancedRiskAssessor(outcome_store=store, history_cache_size=3)
+        for i in range(10):
+            assessor.assess(make_kill_report(target_module=f"module-{i}"))
+        assert list(assessor._history_cache) == ["module-7", "module-8", "module-9"]
+
+    def test_cached_history_is_read_only(self):
+        assessor = AdvancedRiskAssessor(outcome_store=self._CountingStore())
+        history = assessor._get_module_history("auth-service")
+        with pytest.raises(TypeError):
+            history["false_positive_count"] = 0
+
+
 class TestCalibration:
     """Verify calibrate() adjusts thresholds based on outcome history."""
 